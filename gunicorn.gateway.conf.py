@@ -0,0 +1,13 @@
+import os
+
+# Entry point de produção do gateway:
+#   gunicorn --config gunicorn.gateway.conf.py 'meta_agent:create_gateway_app()'
+# (python meta-agent.py --gateway usa esta configuração quando o gunicorn está instalado)
+bind = f"{os.getenv('HOST', '0.0.0.0')}:{os.getenv('PORT', '8000')}"
+# Um worker: o cache LRU de agentes e o pool de conexões ficam em um só processo
+workers = int(os.getenv('WEB_CONCURRENCY', '1'))
+# Chamadas ao Claude são I/O: as threads atendem os agentes em paralelo
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', '32'))
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '120'))
+accesslog = '-'